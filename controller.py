@@ -12,21 +12,20 @@
 # Imports #
 ###########
 # Standard library
+import csv
 import datetime
 import importlib
 import logging.config
 import logging.handlers
 import os
+import queue
 import sys
+import threading
+import time
 import tkinter as tk
-import webbrowser
 from pathlib import Path
 from tkinter import messagebox
 
-# Third party
-import markdown
-import numpy as np
-
 # Add custom path
 try:
     sys.path.append(os.environ['TMPY'])
@@ -48,6 +47,17 @@ from tmpy import tkgui
 ##########
 logger = logging.getLogger(__name__)
 
+#############
+# Constants #
+#############
+# Settings variable types
+_VARTYPES = {
+    'bool': tk.BooleanVar,
+    'str': tk.StringVar,
+    'int': tk.IntVar,
+    'float': tk.DoubleVar
+}
+
 ###############
 # Application #
 ###############
@@ -64,6 +74,8 @@ class Application(tk.Tk):
         self.NAME = 'Automated HINT'
         self.VERSION = '0.1.3'
         self.EDITED = 'May 29, 2024'
+        self.FLUSH_INTERVAL = 10 # Trials held in memory between CSV writes
+        self.POLL_INTERVAL = 16 # Playback end check interval (ms)
 
         ################
         # Window setup #
@@ -91,10 +103,32 @@ class Application(tk.Tk):
         # (i.e., after settings model has been initialized)
         config = tmpy.functions.logging_funcs.setup_logging(self.NAME)
         logging.config.dictConfig(config)
+        self._start_log_listener()
         logger.debug("Started custom logger")
 
         # Default public attributes
         self.level_data = []
+        self._trial_level = None
+        self._pending_rows = []
+        self._csv_file = None
+        self._csv_writer = None
+        self._matrix = None
+        self._list_rows = None
+        self._routing_cache = (None, None)
+        self._audio_cache = {}
+        self._audio_ends_at = None
+        self._settings_view = None
+        self._save_order = ['trial',
+                            'subject',
+                            'condition',
+                            'list_num',
+                            'sentence_num',
+                            'desired_level_dB',
+                            'correct',
+                            'incorrect',
+                            'step_size',
+                            'response'
+                            ]
         logger.debug("Setting controller 'start' flag to True")
         self.start_flag = True
 
@@ -118,41 +152,38 @@ class Application(tk.Tk):
         self.menu = menus.MainMenu(self, self._app_info)
         self.config(menu=self.menu)
 
-        # Create data handler
-        self.dh = tmpy.handlers.DataHandler()
-
         # Create score model
         self.sm = models.ScoreModel()
 
         # Create callback dictionary
         event_callbacks = {
             # File menu
-            '<<FileSettings>>': lambda _: self._show_settings_view(),
-            '<<FileStart>>': lambda _: self.on_start(),
-            '<<FileQuit>>': lambda _: self._quit(),
+            '<<FileSettings>>': self._show_settings_view,
+            '<<FileStart>>': self.on_start,
+            '<<FileQuit>>': self._quit,
 
             # Tools menu
-            '<<ToolsAudioSettings>>': lambda _: self._show_audio_dialog(),
-            '<<ToolsCalibration>>': lambda _: self._show_calibration_dialog(),
+            '<<ToolsAudioSettings>>': self._show_audio_dialog,
+            '<<ToolsCalibration>>': self._show_calibration_dialog,
 
             # Help menu
-            '<<HelpREADME>>': lambda _: self._show_help(),
-            '<<HelpChangelog>>': lambda _: self._show_changelog(),
+            '<<HelpREADME>>': self._show_help,
+            '<<HelpChangelog>>': self._show_changelog,
 
             # Settings window
-            '<<SettingsSubmit>>': lambda _: self._save_settings(),
+            '<<SettingsSubmit>>': self._save_settings,
 
             # Calibration window
-            '<<CalPlay>>': lambda _: self.play_calibration_file(),
-            '<<CalStop>>': lambda _: self.stop_audio(),
-            '<<CalibrationSubmit>>': lambda _: self._calc_offset(),
+            '<<CalPlay>>': self.play_calibration_file,
+            '<<CalStop>>': self.stop_audio,
+            '<<CalibrationSubmit>>': self._calc_offset,
 
             # Audio settings window
-            '<<AudioViewSubmit>>': lambda _: self._save_settings(),
+            '<<AudioViewSubmit>>': self._save_settings,
 
             # Main View
-            '<<MainNext>>': lambda _: self.on_next(),
-            '<<MainRepeat>>': lambda _: self.play(),
+            '<<MainNext>>': self.on_next,
+            '<<MainRepeat>>': self.play,
         }
 
         # Bind callbacks to sequences
@@ -160,48 +191,6 @@ class Application(tk.Tk):
         for sequence, callback in event_callbacks.items():
             self.bind(sequence, callback)
 
-        ###################
-        # Version Control #
-        ###################
-        # Check for updates
-        if self.settings['check_for_updates'].get() == 'yes':
-            _filepath = self.settings['version_lib_path'].get()
-            u = tkgui.models.VersionModel(_filepath, self.NAME, self.VERSION)
-            if u.status == 'mandatory':
-                logger.critical("This version: %s", self.VERSION)
-                logger.critical("Mandatory update version: %s", u.new_version)
-                messagebox.showerror(
-                    title="New Version Available",
-                    message="A mandatory update is available. Please install " +
-                        f"version {u.new_version} to continue.",
-                    detail=f"You are using version {u.app_version}, but " +
-                        f"version {u.new_version} is available."
-                )
-                logger.critical("Application failed to initialize")
-                self.destroy()
-                return
-            elif u.status == 'optional':
-                messagebox.showwarning(
-                    title="New Version Available",
-                    message="An update is available.",
-                    detail=f"You are using version {u.app_version}, but " +
-                        f"version {u.new_version} is available."
-                )
-            elif u.status == 'current':
-                pass
-            elif u.status == 'app_not_found':
-                messagebox.showerror(
-                    title="Update Check Failed",
-                    message="Cannot retrieve version number!",
-                    detail=f"'{self.NAME}' does not exist in the version library."
-                 )
-            elif u.status == 'library_inaccessible':
-                messagebox.showerror(
-                    title="Update Check Failed",
-                    message="The version library is unreachable!",
-                    detail="Please check that you have access to Starfile."
-                )
-
         # Temporarily disable Help menu until documents are written
         self.menu.help_menu.entryconfig('README...', state='disabled')
 
@@ -214,9 +203,26 @@ class Application(tk.Tk):
         # Center main window
         self.center_window()
 
+        # Start checking for the end of audio playback
+        self.after(self.POLL_INTERVAL, self._poll_playback)
+
         # Initialization successful
         logger.info('Application initialized successfully')
 
+        ###################
+        # Version Control #
+        ###################
+        # Check for updates in the background once the UI is showing:
+        # the version library is on a network share and can be slow.
+        # Sessions cannot be started until the check has finished.
+        if self.settings['check_for_updates'].get() == 'yes':
+            self.menu.file_menu.entryconfig('Start', state='disabled')
+            threading.Thread(
+                target=self._check_version,
+                args=(self.settings['version_lib_path'].get(),),
+                daemon=True
+            ).start()
+
     #####################
     # General Functions #
     #####################
@@ -256,45 +262,146 @@ class Application(tk.Tk):
         return filename
 
 
-    def _quit(self):
+    def _start_log_listener(self):
+        """ Move the configured root logger handlers onto a 
+            background QueueListener, so formatting and writing 
+            log records does not block the Tk event loop.
+        """
+        root_logger = logging.getLogger()
+        handlers = root_logger.handlers[:]
+        log_queue = queue.Queue(-1)
+
+        # Replace configured handlers with a single queue handler
+        for handler in handlers:
+            root_logger.removeHandler(handler)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+        # Configured handlers now run on the listener thread
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, 
+            *handlers, 
+            respect_handler_level=True
+            )
+        self._log_listener.start()
+
+
+    def _quit(self, *_):
         """ Exit the application. """
         logger.info("User ended the session")
+        # Write any trials still held in memory
+        self._close_data_file()
+        # Write any queued log records before closing
+        self._log_listener.stop()
         self.destroy()
 
+    #############################
+    # Version Control Functions #
+    #############################
+    def _check_version(self, filepath):
+        """ Query the version library. Runs on a worker thread;
+            results are passed back to the Tk thread for display.
+        """
+        try:
+            u = tkgui.models.VersionModel(filepath, self.NAME, self.VERSION)
+        except Exception as e:
+            # Do not leave File>Start disabled if the check itself fails
+            logger.exception(e)
+            self.after(0, lambda: self.menu.file_menu.entryconfig(
+                'Start', state='normal'))
+            return
+        self.after(0, lambda: self._show_version_status(u))
+
+
+    def _show_version_status(self, u):
+        """ Notify the user of the result of the update check.
+            File>Start is re-enabled unless an update is mandatory.
+        """
+        if u.status == 'mandatory':
+            logger.critical("This version: %s", self.VERSION)
+            logger.critical("Mandatory update version: %s", u.new_version)
+            messagebox.showerror(
+                title="New Version Available",
+                message="A mandatory update is available. Please install " +
+                    f"version {u.new_version} to continue.",
+                detail=f"You are using version {u.app_version}, but " +
+                    f"version {u.new_version} is available."
+            )
+            logger.critical("Mandatory update required: closing application")
+            self._quit()
+            return
+        elif u.status == 'optional':
+            messagebox.showwarning(
+                title="New Version Available",
+                message="An update is available.",
+                detail=f"You are using version {u.app_version}, but " +
+                    f"version {u.new_version} is available."
+            )
+        elif u.status == 'current':
+            pass
+        elif u.status == 'app_not_found':
+            messagebox.showerror(
+                title="Update Check Failed",
+                message="Cannot retrieve version number!",
+                detail=f"'{self.NAME}' does not exist in the version library."
+             )
+        elif u.status == 'library_inaccessible':
+            messagebox.showerror(
+                title="Update Check Failed",
+                message="The version library is unreachable!",
+                detail="Please check that you have access to Starfile."
+            )
+
+        # Allow sessions to start (any result but a mandatory update)
+        self.menu.file_menu.entryconfig('Start', state='normal')
+
     ###################
     # File Menu Funcs #
     ###################
-    def _show_settings_view(self):
+    def _show_settings_view(self, *_):
         """ Show session parameter dialog. """
         logger.debug("Calling settings view")
-        views.SettingsView(self, self.settings)
+        # Build the view once, then reuse it on later opens
+        if self._settings_view is None:
+            self._settings_view = views.SettingsView(self, self.settings)
+        else:
+            self._settings_view.show()
 
 
     def _prepare_trials(self):
         """ Import matrix file and organize trials. """
-        # Create dict of arguments
-        pars = {
-            'filepath': stimuli.HINT_SENTENCES,
-        }
+        # Import matrix file and index rows by list number 
+        # on first run only
+        if self._list_rows is None:
+            mf = models.HINTMatrix(filepath=stimuli.HINT_SENTENCES)
+            self._matrix = mf.import_matrix_file()
+            self._list_rows = self._matrix.groupby(
+                'list_num', observed=True).indices
 
-        # Create matrix object
-        mf = models.HINTMatrix(**pars)
-        matrix = mf.import_matrix_file()
-        
         # Convert string of HINT list numbers to list
         lists = tmpy.functions.helper_funcs.string_to_list(
             string_list=self.settings['lists'].get(),
             datatype='int'
             )
         
-        # Grab specified lists
-        mask = matrix['list_num'].isin(lists)
-        trials_df = matrix[mask]
+        # Grab specified lists (keeping matrix row order, ignoring 
+        # duplicates and unknown list numbers)
+        rows = sorted(
+            row for ii in set(lists) if ii in self._list_rows
+            for row in self._list_rows[ii]
+        )
+        if not rows:
+            logger.error("No matching lists: %s", lists)
+            messagebox.showerror(
+                title="Invalid Lists",
+                message="None of the selected lists exist!",
+                detail="Go to File>Settings to specify valid list numbers."
+            )
+            return
 
-        return trials_df
+        return self._matrix.iloc[rows]
 
 
-    def on_start(self):
+    def on_start(self, *_):
         """ Import matrix file and create TrialHandler. """
         logger.debug("Start button pressed")
 
@@ -303,6 +410,11 @@ class Application(tk.Tk):
 
         # Prepare trials
         trials = self._prepare_trials()
+        if trials is None:
+            return
+
+        # Load audio for all selected sentences before the first trial
+        self._preload_audio(trials['file'])
 
         # Update MainView label to display current level
         self.main_view.update_level_source()
@@ -320,6 +432,11 @@ class Application(tk.Tk):
             step_sizes=steps
             )
 
+        # Open data file once trials are ready 
+        # (do not start a session that cannot be saved)
+        if not self._open_data_file():
+            return
+
         # Disable "Start" from File menu
         self.menu.file_menu.entryconfig('Start', state='disabled')
 
@@ -342,32 +459,37 @@ class Application(tk.Tk):
 
             Do NOT use: self.settings['desired_level_dB'].get()
         """
-        self._calc_level(self.ath.parameter)
+        levels = self._calc_level(self.ath.parameter)
 
         # Add directory to file name
-        stim = Path(os.path.join(
-            stimuli.HINT_AUDIO,
-            self.ath.trial_info['file']
-            )
-            )
-        
-        return stim
+        stim = self._stim_path(self.ath.trial_info['file'])
+
+        return stim, levels
 
 
-    def play(self):
+    def _stim_path(self, filename):
+        """ Add directory to stimulus file name. """
+        return Path(os.path.join(stimuli.HINT_AUDIO, filename))
+
+
+    def play(self, *_):
         """ Begin audio playback. """
         # Prepare audio for playback
-        stim = self._prepare_stimulus()
+        stim, levels = self._prepare_stimulus()
+        self._trial_level = levels['desired_level_dB']
         
         # Present WGN
         self.present_audio(
             audio=stim,
-            pres_level=self.settings['adjusted_level_dB'].get()
+            pres_level=levels['adjusted_level_dB']
             )
         
 
     def _end_of_task(self):
         """ Present message to user and destroy root. """
+        # Write remaining trials to CSV
+        self._close_data_file()
+
         # Calculate the final SNR outcome of the HINT
         self.sm.get_snr(
             trial_levels=self.level_data, 
@@ -380,36 +502,21 @@ class Application(tk.Tk):
             detail=f"HINT score: {self.sm.final_snr} dB SNR"
         )
         logger.debug("Closing application")
+        self._log_listener.stop()
         self.quit()
 
 
-    def _save(self, responses):
-        """ Save data to CSV, on a per trial basis, 
-            after scoring each trial. 
+    def _open_data_file(self):
+        """ Open the session CSV for appending and write the header
+            if the file is new. The file and writer stay open until 
+            the session ends.
         """
         # Add directory to filename
         directory = 'Data'
         fullpath = os.path.join(directory, self.filename)
 
-        # Define items to include in CSV
-        order = ['trial',
-                 'subject', 
-                 'condition', 
-                 'list_num',
-                 'sentence_num',
-                 'desired_level_dB',
-                 'correct',
-                 'incorrect',
-                 'step_size',
-                 'response'
-                 ]
-
         try:
-            self.dh.save_data(
-                filepath=fullpath,
-                dict_list=[self.settings, responses, self.ath.trial_info],
-                order=order
-            )
+            self._csv_file = open(fullpath, 'a', newline='', buffering=65536)
         except PermissionError as e:
             logger.exception(e)
             messagebox.showerror(
@@ -417,7 +524,7 @@ class Application(tk.Tk):
                 message="Data not saved! Cannot write to file!",
                 detail=e
             )
-            return
+            return False
         except OSError as e:
             logger.exception(e)
             messagebox.showerror(
@@ -425,26 +532,90 @@ class Application(tk.Tk):
                 message="Cannot find file or directory!",
                 detail=e
             )
+            return False
+
+        self._csv_writer = csv.DictWriter(
+            self._csv_file, 
+            fieldnames=self._save_order, 
+            extrasaction='ignore'
+            )
+        # Never overwrite existing data: only new files get a header
+        if self._csv_file.tell() == 0:
+            self._csv_writer.writeheader()
+        return True
+
+
+    def _close_data_file(self):
+        """ Write any pending trials and close the session CSV. """
+        if self._csv_file is None:
             return
-        
+        self._flush_rows()
+        # Make sure the session data reaches the disk before closing
+        try:
+            self._csv_file.flush()
+            os.fsync(self._csv_file.fileno())
+        except OSError as e:
+            logger.exception(e)
+        self._csv_file.close()
+        self._csv_file = None
+        self._csv_writer = None
+
 
-    def on_next(self):
+    def _save(self):
+        """ Store scored trial in memory. Rows are written to 
+            CSV in batches by _flush_rows.
+        """
+        # Merge settings, responses and trial info into a single row
+        # (only read the settings that are written to CSV)
+        row = {
+            key: self.settings[key].get() 
+            for key in self._save_order if key in self.settings
+        }
+        row.update(self.sm.resp_dict)
+        row.update(self.ath.trial_info)
+        self._pending_rows.append(row)
+
+
+    def _flush_rows(self):
+        """ Write all pending trials to CSV in a single write. """
+        logger.debug("Writing %d trial(s) to CSV", len(self._pending_rows))
+        try:
+            self._csv_writer.writerows(self._pending_rows)
+            # One flush per batch (not per trial) for crash safety;
+            # fsync is left to _close_data_file
+            self._csv_file.flush()
+        except OSError as e:
+            logger.exception(e)
+            messagebox.showerror(
+                title="Write Failed",
+                message="Data not saved! Cannot write to file!",
+                detail=e
+            )
+            return
+
+        # Clear rows only once they have been written
+        self._pending_rows = []
+
+
+    def on_next(self, *_):
         """ Get and present next trial. """
         logger.debug("Fetching next trial")
 
         # Score and save responses
         if not self.start_flag:
             # Score response
-            scored_words = self.sm.score(
+            self.sm.score(
                 words=self.main_view.words_dict,
                 button_states=self.main_view.buttonstates_dict
             )
 
-            # Write response to CSV
-            self._save(scored_words)
+            # Store response and periodically write to CSV
+            self._save()
+            if len(self._pending_rows) >= self.FLUSH_INTERVAL:
+                self._flush_rows()
 
             # Append trial level to level_data
-            self.level_data.append(self.settings['desired_level_dB'].get())
+            self.level_data.append(self._trial_level)
         
         if self.start_flag:
             # Set start flag to False after intitial trial
@@ -474,29 +645,30 @@ class Application(tk.Tk):
         # Present audio
         self.play()
 
-        # Enable user controls after playback
-        self.after(int(np.ceil(self.a.dur*1000)), 
-                   lambda: self.main_view.enable_user_controls(text="Next")
-                   )
+        # Enable user controls after playback (see _poll_playback)
+        self._audio_ends_at = time.monotonic() + self.a.dur
+
+
+    def _poll_playback(self):
+        """ Enable user controls once the current sentence has 
+            finished playing. Runs on a steady tick, rather than a 
+            single long timer, for consistent re-enable timing.
+        """
+        if self._audio_ends_at and time.monotonic() >= self._audio_ends_at:
+            self._audio_ends_at = None
+            self.main_view.enable_user_controls(text="Next")
+        self.after(self.POLL_INTERVAL, self._poll_playback)
 
     ###########################
     # Settings View Functions #
     ###########################
     def _load_settings(self):
         """ Load parameters into self.settings dict. """
-        # Variable types
-        vartypes = {
-        'bool': tk.BooleanVar,
-        'str': tk.StringVar,
-        'int': tk.IntVar,
-        'float': tk.DoubleVar
-        }
-
         # Create runtime dict from settingsmodel fields
-        self.settings = dict()
-        for key, data in self.settings_model.fields.items():
-            vartype = vartypes.get(data['type'], tk.StringVar)
-            self.settings[key] = vartype(value=data['value'])
+        self.settings = {
+            key: _VARTYPES.get(data['type'], tk.StringVar)(value=data['value'])
+            for key, data in self.settings_model.fields.items()
+        }
         logger.debug("Loaded settings model fields into " +
             "running settings dict")
 
@@ -506,18 +678,19 @@ class Application(tk.Tk):
         logger.debug("Calling settings model set and save funcs")
         for key, variable in self.settings.items():
             self.settings_model.set(key, variable.get())
-            self.settings_model.save()
+        # Write to file once after all fields have been updated
+        self.settings_model.save()
 
     ########################
     # Tools Menu Functions #
     ########################
-    def _show_audio_dialog(self):
+    def _show_audio_dialog(self, *_):
         """ Show audio settings dialog. """
         logger.debug("Calling audio device window")
         tkgui.views.AudioView(self, self.settings)
 
 
-    def _show_calibration_dialog(self):
+    def _show_calibration_dialog(self, *_):
         """ Display the calibration dialog window. """
         logger.debug("Calling calibration window")
         tkgui.views.CalibrationView(self, self.settings)
@@ -525,7 +698,7 @@ class Application(tk.Tk):
     ################################
     # Calibration Dialog Functions #
     ################################
-    def play_calibration_file(self):
+    def play_calibration_file(self, *_):
         """ Load calibration file and present. """
         logger.debug("Play calibration file called")
         # Get calibration file
@@ -545,7 +718,7 @@ class Application(tk.Tk):
         )
 
 
-    def _calc_offset(self):
+    def _calc_offset(self, *_):
         """ Calculate offset based on SLM reading. """
         # Calculate new presentation level
         self.calibration_model.calc_offset()
@@ -558,46 +731,102 @@ class Application(tk.Tk):
         # Calculate new presentation level
         self.calibration_model.calc_level(desired_spl)
         # Save level - this must be called here!
-        self._save_settings()
+        # Only the level fields change on each trial, so update 
+        # just those instead of every setting
+        levels = {
+            key: self.settings[key].get() 
+            for key in ('desired_level_dB', 'adjusted_level_dB')
+        }
+        for key, value in levels.items():
+            self.settings_model.set(key, value)
+        self.settings_model.save()
+
+        return levels
 
     #######################
     # Help Menu Functions #
     #######################
-    def _show_help(self):
-        """ Create html help file and display in default browser. """
-        logger.debug("Calling README file (will open in browser)")
+    def _build_html(self, md_path, html_path):
+        """ Convert markdown file to html. Conversion is skipped
+            if the html file is already newer than the markdown.
+        """
+        try:
+            if os.path.getmtime(html_path) >= os.path.getmtime(md_path):
+                logger.debug("Using existing html file: %s", html_path)
+                return
+        except OSError:
+            # html file has not been created yet
+            pass
+
+        # Imported here to keep it out of application startup
+        # (and out of opens where the html is already current)
+        import markdown
+
         # Read markdown file and convert to html
-        with open(app_assets.README.README_MD, 'r') as f:
+        with open(md_path, 'r') as f:
             text = f.read()
             html = markdown.markdown(text)
 
         # Create html file for display
-        with open(app_assets.README.README_HTML, 'w') as f:
+        with open(html_path, 'w') as f:
             f.write(html)
 
+
+    def _show_help(self, *_):
+        """ Create html help file and display in default browser. """
+        logger.debug("Calling README file (will open in browser)")
+        self._build_html(
+            app_assets.README.README_MD, 
+            app_assets.README.README_HTML
+            )
+
         # Open README in default web browser
+        import webbrowser
         webbrowser.open(app_assets.README.README_HTML)
 
 
-    def _show_changelog(self):
+    def _show_changelog(self, *_):
         """ Create html CHANGELOG file and display in default browser. """
         logger.debug("Calling CHANGELOG file (will open in browser)")
-        # Read markdown file and convert to html
-        with open(app_assets.CHANGELOG.CHANGELOG_MD, 'r') as f:
-            text = f.read()
-            html = markdown.markdown(text)
-
-        # Create html file for display
-        with open(app_assets.CHANGELOG.CHANGELOG_HTML, 'w') as f:
-            f.write(html)
+        self._build_html(
+            app_assets.CHANGELOG.CHANGELOG_MD, 
+            app_assets.CHANGELOG.CHANGELOG_HTML
+            )
 
         # Open CHANGELOG in default web browser
+        import webbrowser
         webbrowser.open(app_assets.CHANGELOG.CHANGELOG_HTML)
 
     ###################
     # Audio Functions #
     ###################
+    def _preload_audio(self, filenames):
+        """ Create audio objects for the given stimulus files ahead
+            of time, so playback does not wait on reading from disk.
+            Files that fail to load are left for _create_audio_object
+            to report when they are presented.
+        """
+        logger.debug("Preloading audio files")
+        for filename in filenames:
+            stim = self._stim_path(filename)
+            if stim in self._audio_cache:
+                continue
+            try:
+                self._audio_cache[stim] = tmpy.audio_handlers.AudioPlayer(
+                    audio=stim
+                )
+            except (FileNotFoundError,
+                    tmpy.audio_handlers.InvalidAudioType,
+                    tmpy.audio_handlers.MissingSamplingRate):
+                logger.warning("Could not preload audio file: %s", stim)
+
+
     def _create_audio_object(self, audio, **kwargs):
+        # Use preloaded audio object if available
+        if not kwargs and audio in self._audio_cache:
+            self.a = self._audio_cache[audio]
+            return
+
         # Create audio object
         try:
             self.a = tmpy.audio_handlers.AudioPlayer(
@@ -623,10 +852,15 @@ class Application(tk.Tk):
         """ Convert space-separated string to list of ints
             for speaker routing.
         """
+        # Routing rarely changes between trials: reuse last result
+        cached_string, cached_routing = self._routing_cache
+        if routing == cached_string:
+            return cached_routing
+
         logger.debug("Formatting channel routing string as list")
-        routing = routing.split()
-        routing = [int(x) for x in routing]
-        return routing
+        formatted = [int(x) for x in routing.split()]
+        self._routing_cache = (routing, formatted)
+        return formatted
     
 
     def _play(self, pres_level):
@@ -696,7 +930,7 @@ class Application(tk.Tk):
         self._play(pres_level)
 
 
-    def stop_audio(self):
+    def stop_audio(self, *_):
         """ Stop audio playback. """
         logger.debug("User stopped audio playback")
         try:
@@ -41,9 +41,13 @@ class HINTMatrix(MatrixFile):
         try:
             # Import matrix file
             matrix_df = self.import_file(self.kwargs['filepath'])
-            return matrix_df
         except TypeError as e:
             logger.error(e)
+            return
+
+        # List numbers are a small set of repeated keys
+        matrix_df['list_num'] = matrix_df['list_num'].astype('category')
+        return matrix_df
 
 
 if __name__ == "__main__":
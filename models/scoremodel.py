@@ -10,7 +10,7 @@
 ###########
 # Standard library
 import logging
-import statistics
+from statistics import fmean
 
 ###########
 # Logging #
@@ -25,6 +25,7 @@ class ScoreModel:
         """ Instantiate a ScoreModel object. """
         logger.debug("Initializing ScoreModel")
         self.outcome = None
+        self.resp_dict = None
 
 
     def _get_word_lists(self, words, button_states):
@@ -34,22 +35,16 @@ class ScoreModel:
             incorrect lists.
         """
         logger.debug("Getting words marked correct and incorrect")
-        correct = []
-        incorrect = []
-        resp_dict = {'correct': correct, 'incorrect': incorrect}
-        for key, value in button_states.items():
-            if value.get() == 1:
-                resp_dict['correct'].append(
-                    words[key].cget('text')
-                    )
-            elif value.get() == 0:
-                resp_dict['incorrect'].append(
-                    words[key].cget('text')
-                    )
-        logger.debug("Correct: %s", resp_dict['correct'])
-        logger.debug("Incorrect: %s", resp_dict['incorrect'])
-
-        return resp_dict
+        # Read each checkbutton state only once
+        states = {key: value.get() for key, value in button_states.items()}
+        correct = [words[key].cget('text') 
+                   for key, state in states.items() if state == 1]
+        incorrect = [words[key].cget('text') 
+                     for key, state in states.items() if state == 0]
+        logger.debug("Correct: %s", correct)
+        logger.debug("Incorrect: %s", incorrect)
+
+        return {'correct': correct, 'incorrect': incorrect}
 
 
     def _get_outcome(self, resp_dict):
@@ -72,16 +67,17 @@ class ScoreModel:
             based on any incorrectly identified words.
         """
         # Get lists of correct and incorrect words
-        resp_dict = self._get_word_lists(
+        # (stored in public attribute for saving to CSV)
+        self.resp_dict = self._get_word_lists(
             words=words,
             button_states=button_states
             )
 
         # Score the trial (outcome stored in public attribute)
-        self._get_outcome(resp_dict)
+        self._get_outcome(self.resp_dict)
 
         # Return resp_dict of words to save to CSV
-        return resp_dict
+        return self.resp_dict
 
 
     def get_snr(self, trial_levels, noise_level):
@@ -90,7 +86,7 @@ class ScoreModel:
         """
         logger.debug("Calculating final SNR")
         # Average of trials five to end
-        avg_level = statistics.mean(trial_levels[4:])
+        avg_level = fmean(trial_levels[4:])
         self.final_snr = round(avg_level - noise_level, 2)
 
 
@@ -22,9 +22,73 @@ from models.scoremodel import ScoreModel
 def scoremodel():
     return ScoreModel()
 
+
+class FakeLabel:
+    """ Stand-in for a ttk.Label holding a word. """
+    def __init__(self, text):
+        self.text = text
+
+    def cget(self, option):
+        return self.text
+
+
+class FakeIntVar:
+    """ Stand-in for a tk.IntVar checkbutton state. """
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+@pytest.fixture
+def sentence():
+    words = {ii: FakeLabel(w) for ii, w in enumerate(
+        ["The", "BOY", "FELL", "from", "the", "WINDOW"])}
+    return words
+
 ##############
 # Unit Tests #
 ##############
+class Test_ScoreModel:
+    """ Tests for the ScoreModel class. """
+    def test_score_all_correct(self, scoremodel, sentence):
+        # Arrange
+        states = {1: FakeIntVar(1), 2: FakeIntVar(1), 5: FakeIntVar(1)}
+
+        # Act
+        resp = scoremodel.score(words=sentence, button_states=states)
+
+        # Assert
+        assert resp == {'correct': ['BOY', 'FELL', 'WINDOW'], 'incorrect': []}
+        assert scoremodel.outcome == 1
+
+
+    def test_score_some_incorrect(self, scoremodel, sentence):
+        # Arrange
+        states = {1: FakeIntVar(1), 2: FakeIntVar(0), 5: FakeIntVar(0)}
+
+        # Act
+        resp = scoremodel.score(words=sentence, button_states=states)
+
+        # Assert
+        assert resp == {'correct': ['BOY'], 'incorrect': ['FELL', 'WINDOW']}
+        assert scoremodel.outcome == -1
+        assert scoremodel.resp_dict is resp
+
+
+    def test_get_snr_ignores_first_four_trials(self, scoremodel):
+        # Arrange
+        levels = [80.0, 76.0, 72.0, 68.0, 64.0, 66.0, 65.0]
+
+        # Act
+        scoremodel.get_snr(trial_levels=levels, noise_level=65.0)
+
+        # Assert
+        assert scoremodel.final_snr == 0.0
+
+
+
 # class Test_Speaker:
 #     """ Tests for the HintModel class. """
 #     def test_init(self, hintmodel):
@@ -12,7 +12,7 @@ import logging
 import os
 import sys
 import tkinter as tk
-from idlelib.tooltip import Hovertip
+import types
 from tkinter import ttk
 
 ###########
@@ -21,11 +21,128 @@ from tkinter import ttk
 # Create new logger
 logger = logging.getLogger(__name__)
 
+#############
+# Constants #
+#############
+# Shared frame and widget grid settings
+_FRAME_OPTS = types.MappingProxyType(
+    {'padx': 10, 'pady': 10, 'ipadx': 5, 'ipady': 5})
+_WIDGET_OPTS = types.MappingProxyType({'padx': 5, 'pady': (10, 0)})
+
+# Tooltip delay (ms)
+_TOOLTIP_DELAY = 1000
+
+##################
+# SharedHovertip #
+##################
+class SharedHovertip:
+    """ A single tooltip window shared by every anchor widget.
+        Anchors only store their text; the window is reused and
+        updated on hover.
+    """
+    _window = None
+    _label = None
+    _after_id = None
+
+    @classmethod
+    def attach(cls, widget, text, delay=1000):
+        """ Display text in the shared tooltip while hovering
+            over widget. Nothing is created until the first hover.
+        """
+        widget.bind('<Enter>', 
+            lambda _: cls._schedule(widget, text, delay), add='+')
+        widget.bind('<Leave>', lambda _: cls._hide(widget), add='+')
+        widget.bind('<ButtonPress>', lambda _: cls._hide(widget), add='+')
+
+
+    @classmethod
+    def _create_window(cls, widget):
+        """ Create the tooltip window on first use, owned by the 
+            root window so it outlives individual dialogs.
+        """
+        if cls._window is not None and cls._window.winfo_exists():
+            return
+        cls._window = tk.Toplevel(widget._root())
+        cls._window.withdraw()
+        cls._window.wm_overrideredirect(True)
+        cls._label = tk.Label(cls._window, 
+                              justify='left', 
+                              background="#ffffe0", 
+                              relief='solid', 
+                              borderwidth=1
+                              )
+        cls._label.pack()
+
+
+    @classmethod
+    def _schedule(cls, widget, text, delay):
+        """ Show tooltip after delay (ms). """
+        cls._cancel(widget)
+        cls._after_id = widget.after(delay, lambda: cls._show(widget, text))
+
+
+    @classmethod
+    def _show(cls, widget, text):
+        """ Update tooltip text and display it next to the pointer. """
+        cls._after_id = None
+        cls._create_window(widget)
+        x, y = widget.winfo_pointerxy()
+        cls._label.config(text=text)
+        cls._window.wm_geometry(f"+{x + 10}+{y + 10}")
+        cls._window.deiconify()
+        cls._window.lift()
+
+
+    @classmethod
+    def _hide(cls, widget):
+        """ Cancel any pending tooltip and hide the window. """
+        cls._cancel(widget)
+        if cls._window is not None and cls._window.winfo_exists():
+            cls._window.withdraw()
+
+
+    @classmethod
+    def _cancel(cls, widget):
+        """ Cancel a scheduled tooltip. """
+        if cls._after_id is not None:
+            widget.after_cancel(cls._after_id)
+            cls._after_id = None
+
 ################
 # SettingsView #
 ################
 class SettingsView(tk.Toplevel):
     """ View for setting session parameters. """
+    # Label frames: (name, text)
+    _FRAMES = (
+        ('session', "Settings"),
+        ('sentence', "Sentence Options"),
+        ('noise', "Noise Options"),
+    )
+
+    # Fields in display order: 
+    # (settings key, frame, label, tooltip, entry width in characters)
+    _FIELDS = (
+        ('subject', 'session', "Subject:",
+            "A unique subject identifier." +
+            "\nCan be alpha, numeric, or both.",
+            20),
+        ('condition', 'session', "Condition:",
+            "A unique condition name.\nCan be alpha, numeric, or both." +
+            "\nSeparate words with underscores.",
+            20),
+        ('lists', 'sentence', "List(s):",
+            "The list numbers to include in the session." +
+            "\nSeparate multiple values with a comma and space: 1, 2, 3",
+            20),
+        ('starting_level_dB', 'sentence', "Starting Level:",
+            "A single starting presentation level for the sentences.",
+            7),
+        ('noise_level_dB', 'noise', "Level:",
+            "A single presentation level for the noise.",
+            7),
+    )
+
     def __init__(self, parent, settings, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
         logger.info("Initializing SettingsView")
@@ -38,122 +155,67 @@ class SettingsView(tk.Toplevel):
         self.withdraw()
         self.resizable(False, False)
         self.title("Settings")
-        self.grab_set()
+        self.protocol('WM_DELETE_WINDOW', self._hide)
 
         # Populate view with widgets
         self._draw_widgets()
 
+        # Display window
+        self.show()
+
 
     def _draw_widgets(self):
-        """ Populate the MainView with widgets. """
-        logger.info("Drawing MainView widgets")
+        """ Populate the SettingsView with widgets from _FIELDS. 
+            All widgets are created first, then gridded together 
+            in a single pass.
+        """
+        logger.info("Drawing SettingsView widgets")
+        # (widget, grid options)
+        layout = []
 
         ##########
         # Frames #
         ##########
-        # Tooltip delay (ms)
-        tt_delay = 1000
-
-        # Shared frame settings
-        frame_options = {'padx': 10, 'pady': 10, 'ipadx': 5, 'ipady': 5}
-        widget_options = {'padx': 5, 'pady': (10, 0)}
-
-        # Session info
-        frm_session = ttk.Labelframe(self, text='Settings')
-        frm_session.grid(row=5, column=5, **frame_options, sticky='nsew')
-
-        # Sentence options
-        frm_sentence = ttk.Labelframe(self, text='Sentence Options')
-        frm_sentence.grid(row=10, column=5, **frame_options, sticky='nsew')
-
-        # Noise options
-        frm_noise = ttk.Labelframe(self, text='Noise Options')
-        frm_noise.grid(row=15, column=5, **frame_options, sticky='nsew')
+        frames = {}
+        for row, (name, text) in enumerate(self._FRAMES, start=1):
+            frames[name] = ttk.Labelframe(self, text=text)
+            layout.append((frames[name], 
+                dict(row=row*5, column=5, sticky='nsew', **_FRAME_OPTS)))
 
         ###########
         # Widgets #
         ###########
-        # Subject
-        lbl_sub = ttk.Label(frm_session, text="Subject:")
-        lbl_sub.grid(row=5, column=5, sticky='e', **widget_options)
-        Hovertip(
-            anchor_widget=lbl_sub,
-            text="A unique subject identifier."+
-                "\nCan be alpha, numeric, or both.",
-            hover_delay=tt_delay
-        )
-        ttk.Entry(frm_session, 
-            textvariable=self.settings['subject']
-            ).grid(row=5, column=10, sticky='w', **widget_options)
-
-        # Condition
-        lbl_condition = ttk.Label(frm_session, text="Condition:")
-        lbl_condition.grid(row=10, column=5, sticky='e', **widget_options)
-        Hovertip(
-            anchor_widget=lbl_condition,
-            text="A unique condition name.\nCan be alpha, numeric, or both." +
-                "\nSeparate words with underscores.",
-            hover_delay=tt_delay
-        )
-        ttk.Entry(frm_session, 
-            textvariable=self.settings['condition']
-            ).grid(row=10, column=10, sticky='w', **widget_options)
-        
-        # Lists
-        lbl_lists = ttk.Label(frm_sentence,
-                  text="List(s):",
-                  takefocus=0
-                  )
-        lbl_lists.grid(row=5,
-                         column=5,
-                         sticky='e',
-                         **widget_options
-                         )
-        Hovertip(
-            anchor_widget=lbl_lists,
-            text="The list numbers to include in the session." +
-                "\nSeparate multiple values with a comma and space: 1, 2, 3",
-            hover_delay=tt_delay
-        )
-        ttk.Entry(frm_sentence,
-                  textvariable=self.settings['lists']
-                  ).grid(row=5, column=10, **widget_options)
-        
-        # Sentence level
-        lbl_sentence_level = ttk.Label(frm_sentence, text="Starting Level:")
-        lbl_sentence_level.grid(row=10, 
-                                column=5, 
-                                sticky='e', 
-                                **widget_options
-                                )
-        Hovertip(
-            anchor_widget=lbl_sentence_level,
-            text="A single starting presentation level for the sentences.",
-            hover_delay=tt_delay
-        )
-        ttk.Entry(frm_sentence, width=7,
-            #textvariable=self.settings['desired_level_dB']
-            textvariable=self.settings['starting_level_dB']
-            ).grid(row=10, column=10, sticky='w', **widget_options)
-
-        # Noise level
-        lbl_noise_level = ttk.Label(frm_noise, text="Level:")
-        lbl_noise_level.grid(row=5, column=5, sticky='e', **widget_options)
-        Hovertip(
-            anchor_widget=lbl_noise_level,
-            text="A single presentation level for the noise.",
-            hover_delay=tt_delay
-        )
-        ttk.Entry(frm_noise, width=7,
-            textvariable=self.settings['noise_level_dB']
-            ).grid(row=5, column=10, sticky='w', **widget_options)
+        # Frame row counters
+        rows = dict.fromkeys(frames, 0)
+        for key, frame, label, tooltip, width in self._FIELDS:
+            rows[frame] += 5
+            layout += self._add_field(frames[frame], rows[frame], key, 
+                                      label, tooltip, width)
 
         # Submit button
         btn_submit = ttk.Button(self, text="Submit", command=self._on_submit)
-        btn_submit.grid(row=40, column=5, columnspan=2, pady=(0, 10))
+        layout.append((btn_submit, 
+            dict(row=40, column=5, columnspan=2, pady=(0, 10))))
 
-        # Center the session dialog window
-        self._center_window()
+        ##########
+        # Layout #
+        ##########
+        for widget, options in layout:
+            widget.grid(**options)
+
+
+    def _add_field(self, frame, row, key, label, tooltip, width):
+        """ Create a label (with tooltip) and entry for a single 
+            setting. Returns the widgets and their grid options.
+        """
+        lbl = ttk.Label(frame, text=label)
+        SharedHovertip.attach(lbl, tooltip, delay=_TOOLTIP_DELAY)
+        ent = ttk.Entry(frame, width=width, textvariable=self.settings[key])
+
+        return [
+            (lbl, dict(row=row, column=5, sticky='e', **_WIDGET_OPTS)),
+            (ent, dict(row=row, column=10, sticky='w', **_WIDGET_OPTS)),
+        ]
 
 
     #############
@@ -162,28 +224,49 @@ class SettingsView(tk.Toplevel):
     def _center_window(self):
         """ Center the TopLevel window over the root window. """
         logger.info("Centering window over parent")
-        # Get updated window size (after drawing widgets)
+        # Get updated window size (single geometry pass after 
+        # drawing all widgets)
         self.update_idletasks()
 
+        # Query parent position/size and window size in a single
+        # call to Tcl (instead of one call per value)
+        px, py, pw, ph, w, h = map(int, self.tk.eval(
+            f"list [winfo x {self.parent}] [winfo y {self.parent}] "
+            f"[winfo width {self.parent}] [winfo height {self.parent}] "
+            f"[winfo reqwidth {self}] [winfo reqheight {self}]"
+            ).split())
+
         # Calculate the x and y coordinates to center the window
-        x = self.parent.winfo_x() \
-            + (self.parent.winfo_width() - self.winfo_reqwidth()) // 2
-        y = self.parent.winfo_y() \
-            + (self.parent.winfo_height() - self.winfo_reqheight()) // 2
+        x = px + (pw - w) // 2
+        y = py + (ph - h) // 2
         
         # Set the window position
-        self.geometry("+%d+%d" % (x, y))
+        self.wm_geometry(f"+{x}+{y}")
 
         # Display window
         self.deiconify()
 
 
+    def show(self):
+        """ Center and display the window. Widgets are bound to 
+            the settings variables, so they are already current.
+        """
+        self._center_window()
+        self.grab_set()
+
+
+    def _hide(self):
+        """ Hide the window so it can be reused. """
+        logger.info("Hiding SettingsView instance")
+        self.grab_release()
+        self.withdraw()
+
+
     def _on_submit(self):
         """ Send submit event to controller and close window. """
         logger.info("Sending 'SUBMIT' event to controller")
         self.parent.event_generate('<<SettingsSubmit>>')
-        logger.info("Destroying SettingsView instance")
-        self.destroy()
+        self._hide()
 
 
 if __name__ == "__main__":